@@ -62,6 +62,12 @@ class BaseMinerNeuron(BaseNeuron):
         self.thread: threading.Thread = None
         self.lock = asyncio.Lock()
 
+        # Hotkey -> uid map so blacklist/priority avoid an O(N) list scan
+        # per incoming request; rebuilt whenever the metagraph resyncs.
+        self.hotkey_to_uid = {
+            hk: uid for uid, hk in enumerate(self.metagraph.hotkeys)
+        }
+
     def run(self):
         """
         Initiates and manages the main loop for the miner on the Bittensor network. The main loop handles graceful shutdown on keyboard interrupts and logs unforeseen errors.
@@ -213,3 +219,9 @@ class BaseMinerNeuron(BaseNeuron):
 
         # Sync the metagraph.
         self.metagraph.sync(subtensor=self.subtensor)
+
+        # Registration can shuffle uids; rebuild the lookup used by
+        # blacklist/priority.
+        self.hotkey_to_uid = {
+            hk: uid for uid, hk in enumerate(self.metagraph.hotkeys)
+        }
@@ -57,12 +57,21 @@ class CAsynapse(bt.Synapse):
         allow_mutation=False,
     )
 
+    @staticmethod
+    def _preview(payload: typing.Optional[str]) -> typing.Optional[str]:
+        """First few characters of a payload, enough to identify it in logs."""
+        if payload is None:
+            return None
+        return f"{payload[:24]}...[{len(payload)} chars]"
+
     def __str__(self):
+        # Payloads run to megabytes; render a short preview so logging a
+        # synapse never copies the full compressed state into a string.
         return (
-            f"CAsynapse(initial_state={self.initial_state},"
+            f"CAsynapse(initial_state={self._preview(self.initial_state)},"
             f"timesteps={self.timesteps},"
             f"rule_name={self.rule_name},"
-            f"array_data={self.array_data},"
+            f"array_data={self._preview(self.array_data)},"
             f"axon={self.axon.dict()},"
             f"dendrite={self.dendrite.dict()},"
         )
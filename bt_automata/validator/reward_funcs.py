@@ -17,9 +17,12 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import concurrent.futures
+import functools
+import os
+
 import torch
-import torch.nn.functional as TF
-from typing import Any, List
+from typing import Any, List, Optional
 
 import numpy as np
 from numpy.typing import NDArray
@@ -27,10 +30,32 @@ from numpy.typing import NDArray
 import bittensor as bt
 
 from bt_automata.protocol import CAsynapse
-from bt_automata.utils import rulesets
+from bt_automata.utils import misc, rulesets
 from bt_automata.utils.misc import decompress_and_deserialize
 
 
+def _fast_array_equal(a: NDArray[Any], b: NDArray[Any]) -> bool:
+    """Equality check with early exit on the first mismatching chunk.
+
+    np.array_equal materializes a full boolean temporary and scans all of
+    it; comparing 64K-element chunks bails out as soon as one differs,
+    which is almost immediately for a wrong prediction.
+    """
+    if a.shape != b.shape or a.dtype != b.dtype:
+        return False
+    # Contiguous buffers compare directly at the C level with no
+    # temporaries; memoryview equality bails out on the first difference.
+    if a.flags.c_contiguous and b.flags.c_contiguous:
+        return a.data == b.data
+    af = a.ravel()
+    bf = b.ravel()
+    chunk = 1 << 16
+    for i in range(0, af.size, chunk):
+        if not np.array_equal(af[i : i + chunk], bf[i : i + chunk]):
+            return False
+    return True
+
+
 def get_accuracy(
     ground_truth_array: NDArray[Any],
     response: CAsynapse,
@@ -57,21 +82,134 @@ def get_accuracy(
             bt.logging.debug("Response array is not a numpy array.")
             return 0.0
 
-        accuracy = 1.0 if np.array_equal(ground_truth_array, pred_array) else 0.0
+        accuracy = (
+            1.0 if _fast_array_equal(ground_truth_array, pred_array) else 0.0
+        )
 
     except ValueError as e:
         bt.logging.debug(f"Error in get_accuracy: {e}")
-        accuracy = 0.0
+        return 0.0
+
+    # Formatting the arrays is O(N) per response; the aggregated accuracy
+    # vector is already logged once in get_rewards, so the per-response
+    # comparison dump only renders at trace level.
+    if bt.logging.__trace_on__:
+        ground_truth_str = np.array2string(
+            ground_truth_array, threshold=10, edgeitems=2
+        )
+        pred_array_str = np.array2string(pred_array, threshold=10, edgeitems=2)
+        bt.logging.trace(
+            f"Comparison | \nGround Truth: \n{ground_truth_str} | \nResponse: \n{pred_array_str} | \nAccuracy: {accuracy}"
+        )
 
-    ground_truth_str = np.array2string(ground_truth_array, threshold=10, edgeitems=2)
-    pred_array_str = np.array2string(pred_array, threshold=10, edgeitems=2)
+    return accuracy
 
-    # Log comparison
-    bt.logging.info(
-        f"Comparison | \nGround Truth: \n{ground_truth_str} | \nResponse: \n{pred_array_str} | \nAccuracy: {accuracy}"
-    )
 
-    return accuracy
+def _rule_instance(rule_name: str):
+    """Looks up the shared per-rule instance built at rulesets import."""
+    return rulesets.RULE_INSTANCES[rule_name]
+
+
+@functools.lru_cache(maxsize=32)
+def _simulate_gt(initial_state_data: str, timesteps: int, rule_name: str):
+    """Ground-truth evolution keyed directly on the compressed query payload.
+
+    Keying on the wire string means a replayed or retried query skips the
+    decompression as well as the whole simulation.
+    """
+    initial_state = decompress_and_deserialize(initial_state_data)
+    return rulesets.Simulate1D(
+        initial_state, timesteps, _rule_instance(rule_name), r=1
+    ).run()
+
+
+# Shared pool for response decompression; creating executors per forward
+# costs thread spawns every round, while one module-level pool amortizes
+# them across the validator's lifetime.
+_DECOMP_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(32, os.cpu_count() or 1)
+)
+
+
+def _safe_deserialize(array_data: Optional[str]) -> Optional[NDArray]:
+    """Deserialize one response payload, returning None instead of raising."""
+    if not array_data:
+        return None
+    try:
+        return decompress_and_deserialize(array_data)
+    except Exception as e:
+        bt.logging.debug(f"Failed to deserialize response array: {e}")
+        return None
+
+
+def deserialize_responses(responses: List[CAsynapse]) -> List[Optional[NDArray]]:
+    """
+    Deserializes all response payloads concurrently.
+
+    zlib decompression releases the GIL, so a thread pool scales the
+    decompression phase nearly linearly with the response count.
+
+    Args:
+    - responses (List[CAsynapse]): The responses from the miners.
+
+    Returns:
+    - List[Optional[NDArray]]: The prediction array per response, or None
+      where deserialization failed.
+    """
+    if len(responses) <= 1:
+        return [_safe_deserialize(r.array_data) for r in responses]
+    payloads = [r.array_data for r in responses]
+    if misc.zstd is not None:
+        # All-zstd batches decompress in one C call with shared state;
+        # the helper falls back per-item for mixed or legacy payloads.
+        return misc.decompress_and_deserialize_batch(payloads)
+    return list(_DECOMP_POOL.map(_safe_deserialize, payloads))
+
+
+def batched_accuracies(
+    ground_truth_array: NDArray[Any],
+    pred_arrays: List[Any],
+) -> NDArray[np.float32]:
+    """
+    Scores all predictions against the ground truth in one vectorized sweep.
+
+    Args:
+    - ground_truth_array (NDArray[Any]): The ground truth array for the cellular automata.
+    - pred_arrays (List[Any]): The deserialized prediction arrays; entries that are
+      None or not arrays of matching shape/dtype score 0.
+
+    Returns:
+    - NDArray[np.float32]: The accuracy value (0,1) per prediction.
+    """
+    accuracies = np.zeros(len(pred_arrays), dtype=np.float32)
+    valid_idx = [
+        i
+        for i, pred in enumerate(pred_arrays)
+        if isinstance(pred, np.ndarray)
+        and pred.shape == ground_truth_array.shape
+        and pred.dtype == ground_truth_array.dtype
+    ]
+    if valid_idx:
+        stack = np.stack([pred_arrays[i] for i in valid_idx])
+        matches = (
+            stack.reshape(len(valid_idx), -1) == ground_truth_array.ravel()
+        ).all(axis=1)
+        accuracies[valid_idx] = matches
+    return accuracies
+
+
+def _normalize_process_times(process_times, accuracies):
+    """L2-normalize the process times and pin wrong answers to comp_max.
+
+    Pure float32 NumPy; for the handful of responses per forward the
+    torch versions of these ops spend more time in dispatch and tensor
+    construction than in arithmetic.
+    """
+    pt = np.asarray(process_times, dtype=np.float32)
+    acc = np.asarray(accuracies, dtype=np.float32)
+    pt = pt / max(np.linalg.norm(pt), 1e-12)
+    comp_max = np.float32((1. + pt.max()) / 2.)
+    return np.where(acc != 1., comp_max, pt).astype(np.float32), comp_max
 
 
 def compute_rewards_sigmoid(
@@ -80,25 +218,20 @@ def compute_rewards_sigmoid(
     temp = 5.0,
     scale_mean = 1.0,
 ):
-    if not isinstance(process_times, torch.Tensor):
-        process_times = torch.tensor(process_times)
-    if not isinstance(accuracies, torch.Tensor):
-        accuracies = torch.tensor(accuracies)
-
-    pt_0 = TF.normalize(process_times, dim=0)
-    comp_max = (1. + pt_0.max()) / 2.
-    bad_pred_ids = (accuracies != 1.).nonzero().squeeze()
-    pt_0[bad_pred_ids] = comp_max
+    pt, comp_max = _normalize_process_times(process_times, accuracies)
 
-    pt_1 = torch.hstack((pt_0, torch.tensor([comp_max])))
-    pt_2 = pt_1.mean() * scale_mean - pt_1
-    pt_3 = pt_2 / pt_2.max()
-    pt_4 = temp * pt_3
-    pt_5 = TF.sigmoid(pt_4)
-    pt_res = pt_5[:-1]
+    pt = np.append(pt, comp_max)
+    centered = pt.mean(dtype=np.float32) * scale_mean - pt
+    # All-equal times (e.g. a single responder) center to zero; dividing
+    # by the zero range would turn the whole vector into NaN.
+    span = centered.max() or np.float32(1.)
+    scaled = (temp * centered / span).astype(np.float32)
+    pt_res = (1. / (1. + np.exp(-scaled)))[:-1]
 
-    bt.logging.debug(f"\nsigmoid\n{comp_max=}\n{temp=}\n{scale_mean=}\n{pt_res=}")
-    return pt_res
+    if bt.logging.__debug_on__:
+        bt.logging.debug(f"\nsigmoid\n{comp_max=}\n{temp=}\n{scale_mean=}\n{pt_res=}")
+    # One torch conversion at the very end, sharing the NumPy buffer.
+    return torch.from_numpy(pt_res.astype(np.float32))
 
 
 def compute_rewards_log(
@@ -107,31 +240,40 @@ def compute_rewards_log(
     temp = 20.0,
     scale_mean = 0.5,
 ):
-    if not isinstance(process_times, torch.Tensor):
-        process_times = torch.tensor(process_times)
-    if not isinstance(accuracies, torch.Tensor):
-        accuracies = torch.tensor(accuracies)
-
-    pt_0 = TF.normalize(process_times, dim=0)
-    comp_max = (1. + pt_0.max()) / 2.
-    bad_pred_ids = (accuracies != 1.).nonzero().squeeze()
-    pt_0[bad_pred_ids] = comp_max
-
-#    pt_1 = torch.hstack((pt_0, torch.tensor([comp_max])))
-    pt_1 = pt_0
-    pt_2 = pt_1.mean() * scale_mean - pt_1
-    pt_3 = pt_2 / pt_2.max()
-    pt_4 = temp * pt_3
-    pt_5 = 1. - pt_4.min() + pt_4
-    pt_6 = torch.log(pt_5)
-#    pt_6 = pt_5
-    pt_7 = pt_6
-    pt_8 = pt_7 - pt_7.min()
-    pt_9 = pt_8 / pt_8.max()
-    pt_res = pt_9
-
-    bt.logging.debug(f"\nlog\n{comp_max=}\n{temp=}\n{scale_mean=}\n{pt_res=}")
-    return pt_res
+    pt, comp_max = _normalize_process_times(process_times, accuracies)
+
+    centered = pt.mean(dtype=np.float32) * scale_mean - pt
+    span = centered.max() or np.float32(1.)
+    scaled = (temp * centered / span).astype(np.float32)
+    logged = np.log(np.float32(1.) - scaled.min() + scaled)
+    shifted = logged - logged.min()
+    pt_res = shifted / (shifted.max() or np.float32(1.))
+
+    if bt.logging.__debug_on__:
+        bt.logging.debug(f"\nlog\n{comp_max=}\n{temp=}\n{scale_mean=}\n{pt_res=}")
+    return torch.from_numpy(pt_res.astype(np.float32))
+
+
+def _uids_tensor(responses) -> torch.Tensor:
+    """Collect response uids into one long tensor.
+
+    update_scores scatters by uid, so handing it a tensor directly skips
+    the per-uid .item() round-trips (each a device sync for on-device
+    uids) and the list -> tensor rebuild on the other side.
+    """
+    uids = [uid for uid, _ in responses]
+    if uids and isinstance(uids[0], torch.Tensor):
+        return torch.stack(uids).long()
+    return torch.tensor(uids, dtype=torch.long)
+
+
+def _zero_rewards(self, responses):
+    """Uniform failure result: every responder present scores zero.
+
+    One direct on-device allocation instead of allocate-then-transfer,
+    and the (uids, rewards) contract holds on every exit path.
+    """
+    return _uids_tensor(responses), torch.zeros(len(responses), device=self.device)
 
 
 def get_rewards(
@@ -142,36 +284,47 @@ def get_rewards(
 ) -> torch.FloatTensor:
     if len(responses) == 0:
         bt.logging.info("Got no responses. Returning reward tensor of zeros.")
-        return [], torch.zeros_like(0).to(self.device)  # Fallback strategy: Log and return 0.
+        return _zero_rewards(self, responses)
 
     try:
-        initial_state = decompress_and_deserialize(query_synapse.initial_state)
         timesteps = query_synapse.timesteps
         rule_name = query_synapse.rule_name
 
         if rule_name not in rulesets.rule_classes:
             bt.logging.debug(f"Unknown rule name: {rule_name}")
-            return torch.FloatTensor([]).to(self.device)  # Or handle differently
+            return _zero_rewards(self, responses)
 
         bt.logging.debug(f"Calculating rewards for {len(responses)} responses.")
 
-        rule_func_class = rulesets.rule_classes[rule_name]
-        rule_func_obj = rule_func_class()
+        # Nothing to score means nothing to simulate: skip the ground
+        # truth entirely when no responder returned a payload.
+        if not any(response.array_data for _, response in responses):
+            bt.logging.debug("No response carried array data; scoring all zero.")
+            return _zero_rewards(self, responses)
 
-        gt_array = rulesets.Simulate1D(
-            initial_state, timesteps, rule_func_obj, r=1
-        ).run()
+        gt_array = _simulate_gt(query_synapse.initial_state, timesteps, rule_name)
         if gt_array is None:
             bt.logging.debug("Simulation failed to produce a result.")
-            return torch.FloatTensor([]).to(self.device)  # Or handle differently
+            return _zero_rewards(self, responses)
+
+        # Deserialize every response up front (concurrently) and score them
+        # in one batched comparison rather than per-response Python dispatch.
+        preds = deserialize_responses([response for _, response in responses])
+        accuracies = batched_accuracies(gt_array, preds)
 
-        # Calculate accuracies for each response
-        accuracies = [get_accuracy(gt_array, response) for uid, response in responses]
+        # With every prediction wrong the shaped rewards are zero anyway;
+        # skip the normalize/shape arithmetic.
+        if not accuracies.any():
+            bt.logging.debug("All responses scored zero accuracy.")
+            return _zero_rewards(self, responses)
 
         # Pull the process times from the synapse responses
         process_times = [response.dendrite.process_time for _, response in responses]
-        resp_uids = [uid.item() for uid, _ in responses]
-        bt.logging.debug(f"\n{resp_uids=}\n{process_times=}\n{accuracies=}")
+        resp_uids = _uids_tensor(responses)
+        # f-strings format eagerly; skip rendering the per-miner vectors
+        # unless debug logging is actually on.
+        if bt.logging.__debug_on__:
+            bt.logging.debug(f"\n{resp_uids=}\n{process_times=}\n{accuracies=}")
         if rewards_scale == "log":
             compute_rewards_func = compute_rewards_log
         else:
@@ -181,12 +334,14 @@ def get_rewards(
             process_times,
             accuracies,
         )
-        bt.logging.debug(f"\n{rewards_for_responses=}")
+        if bt.logging.__debug_on__:
+            bt.logging.debug(f"\n{rewards_for_responses=}")
 
     except Exception as e:
         bt.logging.debug(f"Error in get_rewards: {e}")
-        resp_uids = []
-        rewards_for_responses = torch.zeros_like(0).to(self.device)  # Fallback strategy: Log and return 0.
+        # Score every responder zero rather than dropping them: sized by
+        # the actual response count, so update_scores still lines up.
+        resp_uids, rewards_for_responses = _zero_rewards(self, responses)
 
     return resp_uids, rewards_for_responses
 
@@ -17,6 +17,7 @@
 import time
 import typing
 import bittensor as bt
+import numpy as np
 
 import bt_automata
 
@@ -75,7 +76,14 @@ class Miner(BaseMinerNeuron):
             if initial_state is None:
                 raise bt.logging.debug("Failed to deserialize initial state.")
 
-            bt.logging.info("Initial state deserialized: {}".format(initial_state))
+            # Rendering the arrays is O(N); only pay for it when debug
+            # logging is actually on, and abbreviate even then.
+            if bt.logging.__debug_on__:
+                bt.logging.debug(
+                    "Initial state deserialized: {}".format(
+                        np.array2string(initial_state, threshold=10, edgeitems=2)
+                    )
+                )
 
             timesteps = synapse.timesteps
             rule_name = synapse.rule_name
@@ -90,8 +98,11 @@ class Miner(BaseMinerNeuron):
             ca_done = ca_sim.run()
             if ca_done is None:
                 raise bt.logging.debug("Simulation failed to produce a result.")
-            else:
-                bt.logging.info(f"Simulation complete. Result: {ca_done}")
+            elif bt.logging.__debug_on__:
+                bt.logging.debug(
+                    f"Simulation complete. Result: "
+                    f"{np.array2string(ca_done, threshold=10, edgeitems=2)}"
+                )
 
             array_data = serialize_and_compress(ca_done)
             if array_data is None:
@@ -140,7 +151,7 @@ class Miner(BaseMinerNeuron):
         Otherwise, allow the request to be processed further.
         """
         # TODO(developer): Define how miners should blacklist requests.
-        if synapse.dendrite.hotkey not in self.metagraph.hotkeys:
+        if synapse.dendrite.hotkey not in self.hotkey_to_uid:
             # Ignore requests from unrecognized entities.
             bt.logging.trace(
                 f"Blacklisting unrecognized hotkey {synapse.dendrite.hotkey}"
@@ -173,9 +184,9 @@ class Miner(BaseMinerNeuron):
         - A higher stake results in a higher priority value.
         """
         # TODO(developer): Define how miners should prioritize requests.
-        caller_uid = self.metagraph.hotkeys.index(
+        caller_uid = self.hotkey_to_uid[
             synapse.dendrite.hotkey
-        )  # Get the caller index.
+        ]  # Get the caller index.
         prirority = float(
             self.metagraph.S[caller_uid]
         )  # Return the stake as the priority.
@@ -15,9 +15,13 @@
 # DEALINGS IN THE SOFTWARE.
 
 
-import random
+import asyncio
+import operator
+import threading
 import time
 
+import numpy as np
+
 # Bittensor
 import bittensor as bt
 
@@ -32,6 +36,9 @@ from bt_automata.utils import rulesets
 from bt_automata.utils.rulesets import rule_classes
 from bt_automata.utils.misc import serialize_and_compress
 
+# Frozen once at import so pool refills can index it by position.
+ECA_RULE_NAMES = tuple(rule_classes)
+
 
 class Validator(BaseValidatorNeuron):
     """
@@ -51,6 +58,25 @@ class Validator(BaseValidatorNeuron):
         bt.logging.info("load_state()")
         self.load_state()
 
+        # Instance-owned generator: no contention on the random module's
+        # global state, and draws amortize over a pool of precomputed
+        # (size, steps, rule) triples instead of three calls per forward.
+        # The lock serializes refill-and-pop: get_random_params runs on
+        # worker threads, one per concurrent forward.
+        self._rng = np.random.default_rng()
+        self._param_pool = []
+        self._param_lock = threading.Lock()
+
+    def _refill_param_pool(self, n=1024):
+        """Draw n (size, steps, rule_name) triples in three vectorized calls."""
+        sizes = self._rng.integers(250, 501, n)
+        steps = self._rng.integers(250, 501, n)
+        rules = self._rng.choice(len(ECA_RULE_NAMES), n)
+        self._param_pool = [
+            (int(s), int(t), ECA_RULE_NAMES[r])
+            for s, t, r in zip(sizes, steps, rules)
+        ]
+
     def get_random_params(self):
         """Generate random parameters for the cellular automata.
 
@@ -60,34 +86,23 @@ class Validator(BaseValidatorNeuron):
         - rule_name (str): The name of the rule function to use for the cellular automata.
         """
 
-        # size defines the dimensionn of the 1-D array. Between 100-1000
-        size = random.randint(250, 500)
+        # Pop a precomputed (size, steps, rule) triple; size and steps are
+        # both drawn from 250-500 and the rule from the supported Class 3/4
+        # registry, same distributions as the old per-call draws.
+        with self._param_lock:
+            if not self._param_pool:
+                self._refill_param_pool()
+            size, steps, rule_name = self._param_pool.pop()
 
         # Generate the initial state using the ruelsets module
         initial_state_raw = rulesets.get_initial_state(size)
 
-        # Choose a random number of time-steps, between 100 and 1000
-        steps = random.randint(250, 500)
-
-        # Choose a random rule function. Limit to Class 3/4 rules in 1D. Covert it to a rule function using the rule_classes dictionary.
-        rule_name = random.choice(
-            ["Rule30", "Rule54", "Rule62", "Rule110", "Rule124", "Rule126"]
-        )
-
-        if rule_name not in rule_classes:
-            # Rule name not found. Sound the alarm
-            raise bt.logging.debug(
-                f"Rule '{rule_name}' not found in rule_classes dictionary."
-            )
-
-        # Log and return the parameters.
-        if (
-            initial_state_raw is not None
-            and steps is not None
-            and rule_name is not None
-        ):
-            bt.logging.info(
-                f"Generated cellular automata parameters: {initial_state_raw}, {steps}, {rule_name}"
+        # Log a compact summary, and only when debug is on — the old INFO
+        # line rendered the full initial-state repr (kilobytes of ndarray
+        # formatting) every forward regardless of log level.
+        if bt.logging.__debug_on__:
+            bt.logging.debug(
+                f"Generated cellular automata parameters: size={size}, {steps=}, {rule_name=}"
             )
 
         initial_state = serialize_and_compress(initial_state_raw)
@@ -110,6 +125,11 @@ class Validator(BaseValidatorNeuron):
         my_uid = self.metagraph.hotkeys.index(self.wallet.hotkey.ss58_address)
         bt.logging.info(f"Validator {my_uid} running forward pass.")
 
+        # Parameter generation (state draw + compression) is CPU bound and
+        # independent of uid sampling, so run it in a worker thread while
+        # the query setup proceeds.
+        params_task = asyncio.create_task(asyncio.to_thread(self.get_random_params))
+
         # Get the UIDs of the miners
         miner_uids = bt_automata.utils.uids.get_random_uids(
             self,
@@ -118,7 +138,7 @@ class Validator(BaseValidatorNeuron):
         )
 
         # Generate the parameters for the cellular automata
-        initial_state, timesteps, rule_name = self.get_random_params()
+        initial_state, timesteps, rule_name = await params_task
 
         # Instantiate synapse object and populate it with the parameters
         synapse = bt_automata.protocol.CAsynapse(
@@ -129,9 +149,19 @@ class Validator(BaseValidatorNeuron):
 
         bt.logging.info(f"Querying miners: {miner_uids}")
 
-        # Query the miners
-        responses = self.dendrite.query(
-            axons=[self.metagraph.axons[uid] for uid in miner_uids],
+        # Gather the target axons with one attribute walk and a C-level
+        # itemgetter rather than re-resolving self.metagraph.axons per uid.
+        axons = self.metagraph.axons
+        if len(miner_uids) > 1:
+            selected_axons = list(operator.itemgetter(*miner_uids)(axons))
+        else:
+            selected_axons = [axons[uid] for uid in miner_uids]
+
+        # Query the miners. Awaiting the dendrite batches the axon calls
+        # concurrently, so the round takes as long as the slowest miner
+        # instead of the sum of every round trip.
+        responses = await self.dendrite(
+            axons=selected_axons,
             synapse=synapse,
             deserialize=False,
         )
@@ -159,12 +189,15 @@ class Validator(BaseValidatorNeuron):
         except Exception as e:
             bt.logging.error(f"Error scoring responses: {e}")
 
-        # Wait for next round
-        time.sleep(10)
+        # Wait for next round without blocking the event loop.
+        await asyncio.sleep(10)
 
 
 if __name__ == "__main__":
     with Validator() as validator:
+        # The forward loop runs in the background thread; this thread only
+        # keeps the process alive, so wake rarely and log at debug instead
+        # of an INFO line every 5 seconds.
         while True:
-            bt.logging.info("Validator running...", time.time())
-            time.sleep(5)
+            time.sleep(60)
+            bt.logging.debug(f"Validator running... {time.time()}")
@@ -69,8 +69,16 @@ setup_environment() {
 
     cd ../bittensor-subnet-template
 
-    # Install the bittensor-subnet-template python package
-    python -m pip install -e .
+    # Install the bittensor-subnet-template python package.
+    # Skip the pip run entirely when requirements.txt is unchanged since
+    # the last install; resolving dependencies dominates re-setup time.
+    req_hash=$(sha256sum requirements.txt | cut -d' ' -f1)
+    if [ ! -f ".requirements_hash" ] || [ "$(cat .requirements_hash)" != "$req_hash" ]; then
+        python -m pip install -e .
+        echo "$req_hash" > .requirements_hash
+    else
+        echo "Requirements unchanged. Skipping pip install..."
+    fi
 
     # Create and set up wallets
     # This section can be skipped if wallets are already set up
@@ -0,0 +1,150 @@
+# The MIT License (MIT)
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software and associated
+# documentation files (the “Software”), to deal in the Software without restriction, including without limitation
+# the rights to use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of the Software,
+# and to permit persons to whom the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in all copies or substantial portions of
+# the Software.
+
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO
+# THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import unittest
+
+import cellpylib as cpl
+import numpy as np
+
+from bt_automata.utils import life_kernels, rulesets
+
+
+class RulesetsTestCase(unittest.TestCase):
+    """Tests that the vectorized evolution kernels agree with the reference
+    cellpylib evolution for every supported rule."""
+
+    def test_evolve_elementary_matches_cpl(self):
+        for name, rule_class in rulesets.rule_classes.items():
+            with self.subTest(rule=name):
+                ca = cpl.init_random(64)
+                reference = cpl.evolve(
+                    cellular_automaton=ca,
+                    timesteps=32,
+                    apply_rule=rule_class().rule_function,
+                    r=1,
+                )
+                fast = rulesets.evolve_elementary(ca, 32, rule_class.number)
+                self.assertTrue(np.array_equal(reference, fast))
+
+    def test_packed_step_matches_elementary(self):
+        rng = np.random.default_rng(42)
+        for rule_num in rulesets._SWAR_RULE_EXPRS:
+            for size in (64, 100, 257):
+                with self.subTest(rule=rule_num, size=size):
+                    row = rng.integers(0, 2, size).astype(np.int8)
+                    reference = rulesets.evolve_elementary(row, 8, rule_num)
+                    words = rulesets.pack_row(row)
+                    for t in range(1, 8):
+                        words = rulesets.step_elementary_packed(
+                            words, size, rule_num
+                        )
+                        self.assertTrue(
+                            np.array_equal(
+                                rulesets.unpack_row(words, size), reference[t]
+                            )
+                        )
+
+    def test_2d_kernels_match_cpl(self):
+        rng = np.random.default_rng(7)
+        for name, rule_class in rulesets.rule_classes_2D.items():
+            with self.subTest(rule=name):
+                inst = rule_class()
+                grid = (rng.random((16, 16)) < 0.5).astype(np.int8)
+                reference = cpl.evolve2d(
+                    cellular_automaton=grid[None, ...],
+                    timesteps=6,
+                    apply_rule=inst.rule_function,
+                    r=1,
+                    neighbourhood="Moore",
+                )
+                if hasattr(inst, "apply_grid"):
+                    state = grid
+                    for t in range(1, 6):
+                        state = inst.apply_grid(state)
+                        self.assertTrue(np.array_equal(state, reference[t]))
+                    continue
+                jit_state = grid.copy()
+                np_state = grid
+                padded = np.pad(grid, 1, mode="wrap")
+                for t in range(1, 6):
+                    nxt = np.empty_like(jit_state)
+                    life_kernels.STEP_KERNELS[name](jit_state, nxt)
+                    jit_state = nxt
+                    np_state = life_kernels.NP_STEP_KERNELS[name](np_state)
+                    pad_state = life_kernels.PADDED_NP_STEP_KERNELS[name](
+                        padded
+                    )
+                    padded[1:-1, 1:-1] = pad_state
+                    life_kernels.update_ghosts(padded)
+                    self.assertTrue(np.array_equal(jit_state, reference[t]))
+                    self.assertTrue(np.array_equal(np_state, reference[t]))
+                    self.assertTrue(np.array_equal(pad_state, reference[t]))
+
+    def test_tiled_step_matches_row_sweep(self):
+        rng = np.random.default_rng(8)
+        for name, tiled in life_kernels.TILED_STEP_KERNELS.items():
+            with self.subTest(rule=name):
+                grid = (rng.random((128, 96)) < 0.5).astype(np.int8)
+                expected = np.empty_like(grid)
+                got = np.empty_like(grid)
+                for _ in range(3):
+                    life_kernels.STEP_KERNELS[name](grid, expected)
+                    tiled(grid, got)
+                    self.assertTrue(np.array_equal(got, expected))
+                    grid = expected.copy()
+
+    def test_packed_life_step_matches_numpy(self):
+        rng = np.random.default_rng(9)
+        for shape in ((16, 16), (8, 100), (5, 64)):
+            with self.subTest(shape=shape):
+                grid = (rng.random(shape) < 0.5).astype(np.int8)
+                words = life_kernels.pack_grid(grid)
+                state = grid
+                for _ in range(4):
+                    words = life_kernels.step_life_u64(words, shape[1])
+                    state = life_kernels.step_life_np(state)
+                    self.assertTrue(
+                        np.array_equal(
+                            life_kernels.unpack_grid(words, shape[1]), state
+                        )
+                    )
+
+    def test_simulate2d_uses_kernel_fast_path(self):
+        ca = rulesets.get_initial_state_2d(16)
+        result = rulesets.Simulate2D(ca, 6, rulesets.ConwayRule()).run()
+        reference = cpl.evolve2d(
+            cellular_automaton=ca,
+            timesteps=6,
+            apply_rule=rulesets.ConwayRule().rule_function,
+            r=1,
+            neighbourhood="Moore",
+        )
+        self.assertTrue(np.array_equal(reference, result))
+
+    def test_simulate1d_uses_elementary_fast_path(self):
+        ca = rulesets.get_initial_state(64)
+        result = rulesets.Simulate1D(ca, 32, rulesets.Rule110()).run()
+        reference = cpl.evolve(
+            cellular_automaton=ca,
+            timesteps=32,
+            apply_rule=rulesets.Rule110().rule_function,
+            r=1,
+        )
+        self.assertTrue(np.array_equal(reference, result))
+
+
+if __name__ == "__main__":
+    unittest.main()